@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+lt_aot.py
+
+Ahead-of-time build of the light-time kernel (lt_kernel.lt_at) into the
+extension module `lt_mod`, placed next to this file:
+
+    python lt_aot.py
+
+openvocs_delay_bot_spice.py prefers lt_mod when it is importable, so the
+bot neither JIT-compiles at startup nor relies on numba's on-disk cache.
+numba is only needed to build, not to run the module.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from lt_kernel import lt_at
+
+cc = CC("lt_mod")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+cc.export("lt_at", "f8(f8, f8[:], f8, f8)")(lt_at)
+
+if __name__ == "__main__":
+    cc.compile()
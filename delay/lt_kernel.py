@@ -0,0 +1,25 @@
+"""
+lt_kernel.py
+
+Numeric kernel of the delay bot's light-time schedule, kept free of
+SPICE/numba imports so it can be JIT-compiled (numba cache) or built
+ahead of time (lt_aot.py) on its own.
+"""
+
+
+def lt_at(t, coeffs, t0, tscale):
+    """
+    Evaluate a fitted light-time Chebyshev series (Clenshaw) at unix time
+    `t`. Outside the fitted span the edge value is held, not extrapolated.
+    """
+    x = (t - t0) / tscale
+    if x > 1.0:
+        x = 1.0
+    elif x < -1.0:
+        x = -1.0
+
+    b1 = 0.0
+    b2 = 0.0
+    for k in range(len(coeffs) - 1, 0, -1):
+        b1, b2 = 2.0 * x * b1 - b2 + coeffs[k], b1
+    return x * b1 - b2 + coeffs[0]
@@ -14,19 +14,59 @@ In development, you can override the delay with a fixed value
 via the DEV_DELAY_SECONDS environment variable, e.g.:
 
     DEV_DELAY_SECONDS=3 python openvocs_delay_bot_spice.py
+
+With PROCESS_PER_DIRECTION=1 every loop mapping is relayed by its own
+process, so the directions do not share one event loop / CPU core.
+
+For bounded latency jitter, pin the bot to the core that serves the NIC
+RX queue of the multicast traffic, e.g. CPU_AFFINITY=2 NIC_NAME=eth0
+(with PROCESS_PER_DIRECTION=1 the listed CPUs are assigned to the
+workers in turn). Steer the queue/IRQ to that core beforehand, e.g. via
+`ethtool -X eth0 ...` / `set_irq_affinity.sh` or
+/proc/irq/<n>/smp_affinity_list; at startup the bot warns if no IRQ of
+NIC_NAME is served by the pinned CPUs. Busy polling of the NIC queue
+instead of waiting for its interrupt is a host setting for this
+epoll-driven bot: sysctl net.core.busy_poll (microseconds).
 """
 
 import asyncio
+import calendar
+import collections
+import ctypes
+import ctypes.util
 import dataclasses
+import errno
+import logging
+import multiprocessing
+import multiprocessing.connection
 import os
+import signal
 import socket
 import struct
+import sys
 import time
-from typing import Tuple, List
+from typing import Deque, List, Optional, Tuple
 
 import numpy as np
 import spiceypy as spice
 
+try:
+    # Vectorized Cython API, SpiceyPy >= 7
+    from spiceypy import cyice
+except ImportError:
+    cyice = None
+
+try:
+    # libuv based event loop, used when installed (USE_UVLOOP=0 to disable)
+    import uvloop
+except ImportError:
+    uvloop = None
+
+log = logging.getLogger("openvocs.delay")
+
+# Log level of the bot, e.g. LOG_LEVEL=DEBUG to see every SPICE evaluation
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+
 # -------------------- SPICE CONFIG -------------------- #
 
 # Update these paths to where you put your SPICE kernels
@@ -38,8 +78,12 @@ KERNEL_FILES = [
 EARTH_ID = 3
 MARS_ID = 4
 
-# Speed of light in km/s
-C_KM_PER_S = 299_792.458
+# Unix time of the J2000 epoch (2000-01-01T12:00:00 UTC)
+J2000_UNIX = calendar.timegm((2000, 1, 1, 12, 0, 0, 0, 0, 0))
+
+# Debug: derive ET from a formatted UTC string via str2et (the slow path)
+# instead of computing it from unix time, e.g. SPICE_STR2ET=1.
+SPICE_STR2ET = os.environ.get("SPICE_STR2ET", "0") == "1"
 
 # Environment variable override for development:
 # If set (e.g. DEV_DELAY_SECONDS=3), we ignore SPICE completely.
@@ -54,27 +98,68 @@ def load_spice_kernels():
                 f"SPICE kernel not found: {k} (update KERNEL_FILES paths)"
             )
         spice.furnsh(k)
-    print("[SPICE] Kernels loaded.")
+    log.info("[SPICE] Kernels loaded.")
 
 
-def get_current_light_time_seconds_spice() -> float:
+def unix_to_et(t: float) -> float:
     """
-    Compute Earth->Mars one-way light time (seconds) using SPICE ephemeris.
-    Uses numeric barycenter IDs (3, 4) to match de440.bsp coverage.
+    Convert unix time `t` to ephemeris time (TDB seconds past J2000).
+
+    Unix time has no leap seconds, so subtracting J2000_UNIX gives UTC
+    seconds past J2000; deltet() adds ET-UTC (leap seconds from the loaded
+    LSK + 32.184 s + periodic terms). No string formatting/parsing needed.
     """
-    now_utc = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
-    et = spice.str2et(now_utc)
+    if SPICE_STR2ET:
+        utc_str = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(t))
+        return spice.str2et(utc_str + f"{t % 1.0:.6f}"[1:])
+
+    utc = t - J2000_UNIX
+    return utc + spice.deltet(utc, "UTC")
 
-    # Debug: show what IDs we're actually using
-    print(f"[SPICE] Computing lt for target={MARS_ID}, observer={EARTH_ID} at {now_utc}")
 
-    # Use spkgeo with numeric IDs
-    state, _ = spice.spkgeo(MARS_ID, et, "J2000", EARTH_ID)
-    pos_km = np.array(state[:3])
-    dist_km = np.linalg.norm(pos_km)
+def get_light_time_schedule_spice(ets: np.ndarray) -> np.ndarray:
+    """
+    Compute Earth->Mars one-way light time (seconds) for many ephemeris
+    times at once, e.g. to precompute a schedule. Uses numeric barycenter
+    IDs (3, 4) to match de440.bsp coverage.
+
+    "XCN" is the converged transmission case: the signal leaves Earth at
+    each epoch and arrives at Mars, the same light time as
+    spice.ltime(et, EARTH_ID, "->", MARS_ID). With cyice all epochs are
+    evaluated in a single C call.
+    """
+    ets = np.ascontiguousarray(ets, dtype=np.float64)
 
-    lt = dist_km / C_KM_PER_S
-    return float(lt)
+    if cyice is not None:
+        _, lts = cyice.spkez_v(MARS_ID, ets, "J2000", "XCN", EARTH_ID)
+        return np.asarray(lts)
+
+    return np.fromiter(
+        (spice.spkez(MARS_ID, et, "J2000", "XCN", EARTH_ID)[1] for et in ets),
+        dtype=np.float64,
+        count=len(ets),
+    )
+
+
+def load_lt_kernel():
+    """
+    Return (lt_at, compiled): the light-time schedule kernel, preferring
+    the ahead-of-time build (see lt_aot.py) over numba JIT over plain
+    Python. Only production mode needs it, so DEV runs never import numba.
+    """
+    try:
+        from lt_mod import lt_at
+        return lt_at, True
+    except ImportError:
+        pass
+
+    import lt_kernel
+
+    try:
+        from numba import njit
+    except ImportError:
+        return lt_kernel.lt_at, False
+    return njit(cache=True)(lt_kernel.lt_at), True
 
 
 # -------------------- DELAY BOT CONFIG -------------------- #
@@ -115,16 +200,77 @@ LOOP_MAPPINGS: List[LoopMapping] = [
     ),
 ]
 
+# Relay every mapping in its own (spawned) process instead of running all
+# of them on one event loop. A single direction is never split across
+# processes: multicast is delivered to every bound socket, so SO_REUSEPORT
+# would duplicate packets rather than share them, and RTP order must hold.
+PROCESS_PER_DIRECTION = os.environ.get("PROCESS_PER_DIRECTION", "0") == "1"
+
+# uvloop.run() needs uvloop >= 0.18
+USE_UVLOOP = (
+    uvloop is not None
+    and hasattr(uvloop, "run")
+    and os.environ.get("USE_UVLOOP", "1") == "1"
+)
+
+# CPUs to pin the bot to (Linux CPU list, e.g. "2" or "2-3"), empty: no pinning
+CPU_AFFINITY = os.environ.get("CPU_AFFINITY", "")
+
+# Interface receiving the loop multicast, to check its IRQ affinity
+NIC_NAME = os.environ.get("NIC_NAME", "")
+
 # Max UDP packet size for buffering
 MAX_PACKET_SIZE = 2048
 
-# How often (seconds) to recompute light time from SPICE
-LIGHT_TIME_REFRESH_SEC = 60.0
+# Upper bound of packets held back per direction; when exceeded the
+# oldest packet is dropped. None keeps the backlog unbounded.
+MAX_QUEUED_PACKETS: Optional[int] = None
+
+# Max datagrams moved per recvmmsg/sendmmsg call
+MMSG_BATCH_SIZE = 32
+
+# Packets due within this window after the head are sent in the same batch
+TX_BATCH_WINDOW_NS = 200_000
+
+# Kernel socket buffer sizes; the Linux default (~208 KiB) overflows on
+# short scheduling stalls of the bot. Without CAP_NET_ADMIN they are
+# capped by net.core.rmem_max / net.core.wmem_max, raise those via sysctl
+# if a warning is printed.
+RX_SOCKET_BUFFER_BYTES = 4 * 1024 * 1024
+TX_SOCKET_BUFFER_BYTES = 4 * 1024 * 1024
+
+# Not exported by the socket module (Linux values); like SO_RCVBUF /
+# SO_SNDBUF but ignoring the sysctl limits, requires CAP_NET_ADMIN.
+SO_RCVBUFFORCE = getattr(socket, "SO_RCVBUFFORCE", 33)
+SO_SNDBUFFORCE = getattr(socket, "SO_SNDBUFFORCE", 32)
+
+# How often (seconds) to refit the light-time schedule from SPICE
+LIGHT_TIME_REFRESH_SEC = 24 * 3600.0
+
+# The schedule samples SPICE every STEP seconds over the next SPAN seconds
+# (plus one step margin on both sides) and fits a Chebyshev series of
+# DEGREE to it. Light time changes smoothly, the fit error is far below
+# a millisecond.
+LIGHT_TIME_SCHEDULE_SPAN_SEC = 24 * 3600.0
+LIGHT_TIME_SCHEDULE_STEP_SEC = 3600.0
+LIGHT_TIME_CHEB_DEGREE = 8
+
+# How often (seconds) the delay applied to packets is re-evaluated from
+# the schedule. Light time drifts by well under a millisecond per second.
+LIGHT_TIME_UPDATE_SEC = 1.0
 
 
 class LightTimeCache:
     """
     Cache the Earth–Mars light time OR use a fixed override for development.
+
+    In production SPICE is not queried per call: every refresh interval a
+    light-time schedule for the coming day is fitted, and current() only
+    evaluates it for the current time.
+
+    The packet path reads `current_delay_ns`, a plain int (nanoseconds)
+    kept up to date by run_updates(), instead of calling current() per
+    packet.
     """
 
     def __init__(self, refresh_interval: float):
@@ -132,29 +278,88 @@ class LightTimeCache:
         self._last_update = 0.0
         self._cached_value = 600.0  # fallback default if SPICE fails
 
-        if DEV_DELAY_SECONDS > 0:
-            print(
-                f"[LightTime] DEV OVERRIDE ACTIVE — "
-                f"fixed delay = {DEV_DELAY_SECONDS} seconds"
-            )
+        # Fitted schedule, see _fit_schedule()
+        self._coeffs = None
+        self._t0 = 0.0
+        self._tscale = 1.0
+        self._lt_at = None
+        self._lt_at_compiled = False
 
-    def current(self) -> float:
-        # If development override is active, skip SPICE entirely
+        # Decide once which source current() is; the override is fixed at
+        # startup, so there is no need to re-check it on every call.
         if DEV_DELAY_SECONDS > 0:
-            return DEV_DELAY_SECONDS
+            self.current = lambda _delay=DEV_DELAY_SECONDS: _delay
+        else:
+            self._lt_at, self._lt_at_compiled = load_lt_kernel()
+            self.current = self._spice_current
+
+        self.current_delay_ns = round(
+            (DEV_DELAY_SECONDS if DEV_DELAY_SECONDS > 0 else self._cached_value)
+            * 1e9
+        )
+
+    def _fit_schedule(self, now: float) -> float:
+        """
+        Sample SPICE around [now, now + SPAN] and fit the Chebyshev series
+        used by current(). Returns the max. fit error at the samples (s).
+        """
+        step = LIGHT_TIME_SCHEDULE_STEP_SEC
+        ts = now + np.arange(-step, LIGHT_TIME_SCHEDULE_SPAN_SEC + 1.5 * step, step)
 
-        # Production mode: use SPICE
+        ets = np.fromiter((unix_to_et(t) for t in ts), dtype=np.float64, count=len(ts))
+
+        # Debug: show what IDs we're actually using
+        log.debug(
+            "[SPICE] Computing lt for target=%s, observer=%s at ET %.3f .. %.3f",
+            MARS_ID, EARTH_ID, ets[0], ets[-1],
+        )
+        lts = get_light_time_schedule_spice(ets)
+
+        t0 = 0.5 * (ts[0] + ts[-1])
+        tscale = 0.5 * (ts[-1] - ts[0])
+        x = (ts - t0) / tscale
+        coeffs = np.polynomial.chebyshev.chebfit(x, lts, LIGHT_TIME_CHEB_DEGREE)
+        fit_error = float(np.max(np.abs(np.polynomial.chebyshev.chebval(x, coeffs) - lts)))
+
+        # Plain floats are faster to index than numpy scalars in pure Python
+        self._coeffs = coeffs if self._lt_at_compiled else tuple(coeffs.tolist())
+        self._t0 = float(t0)
+        self._tscale = float(tscale)
+        return fit_error
+
+    def _spice_current(self) -> float:
+        """current() in production mode: evaluate the SPICE schedule."""
         now = time.time()
         if now - self._last_update > self._refresh_interval:
             try:
-                lt = get_current_light_time_seconds_spice()
-                self._cached_value = lt
+                fit_error = self._fit_schedule(now)
                 self._last_update = now
-                print(f"[LightTime] SPICE updated — Earth→Mars lt = {lt:.1f} s")
+                lt = self._lt_at(now, self._coeffs, self._t0, self._tscale)
+                log.info(
+                    "[LightTime] SPICE schedule updated — Earth→Mars lt = %.1f s "
+                    "(fit error %.3f ms)", lt, fit_error * 1e3,
+                )
             except Exception as e:
                 # Don’t crash the bot if SPICE fails; keep last good value
-                print(f"[LightTime] SPICE update failed: {e}")
-        return self._cached_value
+                log.warning("[LightTime] SPICE update failed: %s", e)
+
+        if self._coeffs is None:
+            return self._cached_value
+        return self._lt_at(now, self._coeffs, self._t0, self._tscale)
+
+    def update(self) -> int:
+        """Re-evaluate `current_delay_ns`."""
+        self.current_delay_ns = round(self.current() * 1e9)
+        return self.current_delay_ns
+
+    async def run_updates(self, interval: float):
+        """Keep `current_delay_ns` up to date (production mode only)."""
+        if DEV_DELAY_SECONDS > 0:
+            return
+
+        while True:
+            self.update()
+            await asyncio.sleep(interval)
 
 
 light_time_cache = LightTimeCache(LIGHT_TIME_REFRESH_SEC)
@@ -162,12 +367,50 @@ light_time_cache = LightTimeCache(LIGHT_TIME_REFRESH_SEC)
 
 # -------------------- MULTICAST SOCKET HELPERS -------------------- #
 
+# Create sockets non-blocking right away (Linux), saving the fcntl() of
+# setblocking(False). Python opens sockets close-on-exec already.
+_SOCK_NONBLOCK = getattr(socket, "SOCK_NONBLOCK", 0)
+
+
+def new_udp_socket() -> socket.socket:
+    """Create a non-blocking IPv4 UDP socket."""
+    sock = socket.socket(
+        socket.AF_INET, socket.SOCK_DGRAM | _SOCK_NONBLOCK, socket.IPPROTO_UDP
+    )
+    if not _SOCK_NONBLOCK:
+        sock.setblocking(False)
+    return sock
+
+
+def set_socket_buffer(sock: socket.socket, option: int, size: int):
+    """
+    Set SO_RCVBUF / SO_SNDBUF and warn if the kernel capped the value.
+    The *BUFFORCE variant is tried first, it is not limited by sysctl.
+    """
+    force = SO_RCVBUFFORCE if option == socket.SO_RCVBUF else SO_SNDBUFFORCE
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, force, size)
+    except OSError:
+        # No CAP_NET_ADMIN: best effort within net.core.[rw]mem_max
+        sock.setsockopt(socket.SOL_SOCKET, option, size)
+
+    # Linux reports twice the requested size (bookkeeping overhead)
+    actual = sock.getsockopt(socket.SOL_SOCKET, option) // 2
+    if actual < size:
+        name = "SO_RCVBUF" if option == socket.SO_RCVBUF else "SO_SNDBUF"
+        log.warning(
+            "[Socket] %s capped to %d bytes (requested %d), "
+            "check net.core.rmem_max / net.core.wmem_max", name, actual, size,
+        )
+
+
 def create_multicast_rx_socket(group: str, port: int, iface_ip: str) -> socket.socket:
     """
     Create a UDP socket bound to `group:port` and joined to the multicast group.
     """
-    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    sock = new_udp_socket()
     sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    set_socket_buffer(sock, socket.SO_RCVBUF, RX_SOCKET_BUFFER_BYTES)
 
     # Bind to the port on all interfaces
     sock.bind(("", port))
@@ -179,7 +422,6 @@ def create_multicast_rx_socket(group: str, port: int, iface_ip: str) -> socket.s
     # Optional: receive our own sent packets if needed
     sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
 
-    sock.setblocking(False)
     return sock
 
 
@@ -187,7 +429,8 @@ def create_multicast_tx_socket(iface_ip: str) -> socket.socket:
     """
     Create a UDP socket for sending to multicast groups.
     """
-    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    sock = new_udp_socket()
+    set_socket_buffer(sock, socket.SO_SNDBUF, TX_SOCKET_BUFFER_BYTES)
 
     # Bind outgoing interface for multicast (if specified)
     if iface_ip != "0.0.0.0":
@@ -201,12 +444,174 @@ def create_multicast_tx_socket(iface_ip: str) -> socket.socket:
     ttl_bin = struct.pack("b", 16)  # or 1 for very local
     sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, ttl_bin)
 
-    sock.setblocking(False)
     return sock
 
 
+# -------------------- BATCHED UDP I/O -------------------- #
+
+class _IoVec(ctypes.Structure):
+    _fields_ = [
+        ("iov_base", ctypes.c_void_p),
+        ("iov_len", ctypes.c_size_t),
+    ]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IoVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_hdr", _MsgHdr),
+        ("msg_len", ctypes.c_uint),
+    ]
+
+
+def _load_mmsg_libc():
+    """Return libc if it provides recvmmsg/sendmmsg (Linux), else None."""
+    name = ctypes.util.find_library("c")
+    if name is None:
+        return None
+    try:
+        libc = ctypes.CDLL(name, use_errno=True)
+    except OSError:
+        return None
+    if not (hasattr(libc, "recvmmsg") and hasattr(libc, "sendmmsg")):
+        return None
+
+    libc.recvmmsg.argtypes = [
+        ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint,
+        ctypes.c_int, ctypes.c_void_p,
+    ]
+    libc.recvmmsg.restype = ctypes.c_int
+    libc.sendmmsg.argtypes = [
+        ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint, ctypes.c_int,
+    ]
+    libc.sendmmsg.restype = ctypes.c_int
+    return libc
+
+
+_libc = _load_mmsg_libc()
+MMSG_AVAILABLE = _libc is not None
+
+
+class MMsgBatch:
+    """
+    Preallocated mmsghdr vector for moving up to `size` datagrams per
+    syscall. Sockets must be non-blocking (RX) resp. connected (TX).
+    """
+
+    def __init__(self, size: int, bufsize: int = 0):
+        self.size = size
+        self._bufsize = bufsize
+        self._iov = (_IoVec * size)()
+        self._msgs = (_MMsgHdr * size)()
+
+        # One contiguous receive slab, datagram i lands at i * bufsize
+        self._slab = ctypes.create_string_buffer(size * bufsize)
+        self._base = ctypes.addressof(self._slab)
+
+        for i in range(size):
+            if bufsize:
+                self._iov[i].iov_base = self._base + i * bufsize
+                self._iov[i].iov_len = bufsize
+            self._msgs[i].msg_hdr.msg_iov = ctypes.pointer(self._iov[i])
+            self._msgs[i].msg_hdr.msg_iovlen = 1
+
+    def recv(self, fd: int) -> List[bytes]:
+        """Read up to `size` pending datagrams, [] if none are pending."""
+        n = _libc.recvmmsg(fd, self._msgs, self.size, socket.MSG_DONTWAIT, None)
+        if n < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                return []
+            raise OSError(err, os.strerror(err))
+
+        # The only copy: slab -> one bytes object sized to the payload
+        base = self._base
+        bufsize = self._bufsize
+        msgs = self._msgs
+        return [
+            ctypes.string_at(base + i * bufsize, msgs[i].msg_len)
+            for i in range(n)
+        ]
+
+    def send(self, fd: int, packets: List[bytes]) -> int:
+        """
+        Send up to `size` packets, returns the number actually sent
+        (0 if the socket buffer is full).
+        """
+        n = min(len(packets), self.size)
+        for i in range(n):
+            # points into the bytes object itself, `packets` keeps it alive
+            self._iov[i].iov_base = ctypes.cast(
+                ctypes.c_char_p(packets[i]), ctypes.c_void_p
+            ).value
+            self._iov[i].iov_len = len(packets[i])
+
+        sent = _libc.sendmmsg(fd, self._msgs, n, 0)
+        if sent < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                return 0
+            raise OSError(err, os.strerror(err))
+        return sent
+
+
+async def wait_writable(loop: asyncio.AbstractEventLoop, fd: int):
+    """Suspend until `fd` becomes writable."""
+    fut = loop.create_future()
+    loop.add_writer(fd, fut.set_result, None)
+    try:
+        await fut
+    finally:
+        loop.remove_writer(fd)
+
+
 # -------------------- DELAY PIPELINE -------------------- #
 
+class RxProto(asyncio.DatagramProtocol):
+    """
+    Receive side of one relay direction: timestamps every datagram with
+    its send deadline and hands it to the delay queue, directly on the
+    event-loop thread.
+    """
+
+    def __init__(self, queue: Deque[Tuple[int, bytes]],
+                 new_item: asyncio.Event, mapping: LoopMapping):
+        self.queue = queue
+        self.new_item = new_item
+        self.mapping = mapping
+
+    def datagram_received(self, data: bytes, addr):
+        send_time = time.monotonic_ns() + light_time_cache.current_delay_ns
+        self.queue.append((send_time, data))
+        self.new_item.set()
+
+    def error_received(self, exc: Exception):
+        log.warning("[%s] RX socket error: %s", self.mapping.name, exc)
+
+
+class TxProto(asyncio.DatagramProtocol):
+    """
+    Send side of one relay direction; only reports socket errors.
+    """
+
+    def __init__(self, mapping: LoopMapping):
+        self.mapping = mapping
+
+    def error_received(self, exc: Exception):
+        log.warning("[%s] TX socket error: %s", self.mapping.name, exc)
+
+
 async def relay_direction(mapping: LoopMapping):
     """
     One-direction relay:
@@ -218,65 +623,229 @@ async def relay_direction(mapping: LoopMapping):
     )
     tx_sock = create_multicast_tx_socket(mapping.iface_ip)
 
-    print(
-        f"[{mapping.name}] Listening on {mapping.src_group}:{mapping.src_port}, "
-        f"sending to {mapping.dst_group}:{mapping.dst_port}"
+    # Fix the destination once; the kernel keeps the resolved address and
+    # sending needs no per-packet sockaddr. (create_datagram_endpoint does
+    # not accept remote_addr together with sock=.)
+    tx_sock.connect((mapping.dst_group, mapping.dst_port))
+
+    log.info(
+        "[%s] Listening on %s:%d, sending to %s:%d", mapping.name,
+        mapping.src_group, mapping.src_port, mapping.dst_group, mapping.dst_port,
     )
 
     loop = asyncio.get_running_loop()
-    queue: asyncio.PriorityQueue[Tuple[float, bytes]] = asyncio.PriorityQueue()
 
-    async def rx_task():
-        while True:
+    # Every packet is held back by the same delay, so send times arrive
+    # already ordered: a plain FIFO is enough and the sender only ever
+    # has to wait for the head of the queue.
+    queue: Deque[Tuple[int, bytes]] = collections.deque(
+        maxlen=MAX_QUEUED_PACKETS
+    )
+    new_item = asyncio.Event()
+
+    if MMSG_AVAILABLE:
+        # Drain the RX socket in batches; one deadline per batch
+        rx_batch = MMsgBatch(MMSG_BATCH_SIZE, MAX_PACKET_SIZE)
+        tx_batch = MMsgBatch(MMSG_BATCH_SIZE)
+        rx_fd = rx_sock.fileno()
+        tx_fd = tx_sock.fileno()
+
+        rx_retry = None
+
+        def resume_rx():
+            nonlocal rx_retry
+            rx_retry = None
+            loop.add_reader(rx_fd, on_readable)
+
+        def on_readable():
+            nonlocal rx_retry
             try:
-                data, addr = await loop.run_in_executor(
-                    None, rx_sock.recvfrom, MAX_PACKET_SIZE
-                )
+                packets = rx_batch.recv(rx_fd)
             except OSError as e:
-                print(f"[{mapping.name}] RX socket error: {e}")
-                await asyncio.sleep(1.0)
-                continue
+                # The reader is level-triggered: back off instead of
+                # spinning on a persistent error
+                log.warning("[%s] RX socket error: %s", mapping.name, e)
+                loop.remove_reader(rx_fd)
+                rx_retry = loop.call_later(1.0, resume_rx)
+                return
+            if not packets:
+                return
+
+            send_time = time.monotonic_ns() + light_time_cache.current_delay_ns
+            queue.extend((send_time, data) for data in packets)
+            new_item.set()
+
+        loop.add_reader(rx_fd, on_readable)
+
+        async def send(packets: List[bytes]):
+            while packets:
+                try:
+                    sent = tx_batch.send(tx_fd, packets)
+                except OSError as e:
+                    log.warning("[%s] TX socket error: %s", mapping.name, e)
+                    return
+                if sent == 0:
+                    await wait_writable(loop, tx_fd)
+                packets = packets[sent:]
+
+        def close():
+            if rx_retry is not None:
+                rx_retry.cancel()
+            loop.remove_reader(rx_fd)
+            rx_sock.close()
+            tx_sock.close()
+
+    else:
+        # Both sockets are driven by the event loop itself, no executor hops
+        rx_transport, _ = await loop.create_datagram_endpoint(
+            lambda: RxProto(queue, new_item, mapping), sock=rx_sock
+        )
+        tx_transport, _ = await loop.create_datagram_endpoint(
+            lambda: TxProto(mapping), sock=tx_sock
+        )
 
-            delay = light_time_cache.current()
-            send_time = time.monotonic() + delay
-            await queue.put((send_time, data))
+        async def send(packets: List[bytes]):
+            for data in packets:
+                tx_transport.sendto(data)
 
-    async def tx_task():
+        def close():
+            rx_transport.close()
+            tx_transport.close()
+
+    batch_size = MMSG_BATCH_SIZE if MMSG_AVAILABLE else 1
+
+    try:
         while True:
-            send_time, data = await queue.get()
-            now = time.monotonic()
-            sleep_time = send_time - now
-            if sleep_time > 0:
-                await asyncio.sleep(sleep_time)
+            if not queue:
+                new_item.clear()
+                await new_item.wait()
+                continue
 
-            try:
-                await loop.run_in_executor(
-                    None,
-                    tx_sock.sendto,
-                    data,
-                    (mapping.dst_group, mapping.dst_port),
-                )
-            except OSError as e:
-                print(f"[{mapping.name}] TX socket error: {e}")
-                await asyncio.sleep(0.1)
+            # Deadlines are integer nanoseconds, only the sleep is a float
+            send_time, _ = queue[0]
+            now = time.monotonic_ns()
+            if send_time > now:
+                await asyncio.sleep((send_time - now) / 1e9)
+                # The head may have been dropped meanwhile (MAX_QUEUED_PACKETS)
+                continue
+
+            # Flush everything that is due (or nearly due) in one go
+            limit = now + TX_BATCH_WINDOW_NS
+            packets = []
+            while queue and len(packets) < batch_size and queue[0][0] <= limit:
+                packets.append(queue.popleft()[1])
 
-    await asyncio.gather(rx_task(), tx_task())
+            await send(packets)
+    finally:
+        close()
 
 
-async def main():
+async def main(mappings: List[LoopMapping]):
     # Only load SPICE kernels in real mode (no DEV override)
-    if DEV_DELAY_SECONDS <= 0:
+    if DEV_DELAY_SECONDS > 0:
+        log.warning(
+            "[LightTime] DEV OVERRIDE ACTIVE — fixed delay = %s seconds",
+            DEV_DELAY_SECONDS,
+        )
+    else:
         load_spice_kernels()
+        light_time_cache.update()
 
-    tasks = [asyncio.create_task(relay_direction(m)) for m in LOOP_MAPPINGS]
+    tasks = [asyncio.create_task(relay_direction(m)) for m in mappings]
+    tasks.append(
+        asyncio.create_task(light_time_cache.run_updates(LIGHT_TIME_UPDATE_SEC))
+    )
     await asyncio.gather(*tasks)
 
 
-if __name__ == "__main__":
+def parse_cpu_list(text: str) -> List[int]:
+    """Parse a Linux CPU list such as "0-3,8" (sorted, no duplicates)."""
+    cpus = set()
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        first, _, last = part.partition("-")
+        cpus.update(range(int(first), int(last or first) + 1))
+    return sorted(cpus)
+
+
+def check_irq_affinity(nic: str, cpus: List[int]):
+    """
+    Warn if none of the IRQs of `nic` (as named in /proc/interrupts) is
+    served by one of `cpus`.
+    """
+    irqs = []
     try:
-        asyncio.run(main())
+        with open("/proc/interrupts") as f:
+            for line in f:
+                fields = line.split()
+                if not fields or not fields[0][:-1].isdigit():
+                    continue
+                # eth1, eth1-TxRx-0, eth1@pci:... but not eth10
+                name = fields[-1]
+                if name == nic or name.startswith((nic + "-", nic + "@")):
+                    irqs.append(fields[0][:-1])
+    except OSError as e:
+        log.warning("[Affinity] Cannot read /proc/interrupts: %s", e)
+        return
+
+    if not irqs:
+        log.warning("[Affinity] No IRQs found for NIC %s", nic)
+        return
+
+    served = []
+    for irq in irqs:
+        try:
+            with open(f"/proc/irq/{irq}/smp_affinity_list") as f:
+                irq_cpus = parse_cpu_list(f.read())
+        except OSError:
+            continue
+        if set(irq_cpus) & set(cpus):
+            served.append(irq)
+
+    if served:
+        log.info("[Affinity] IRQs %s of %s served by CPUs %s", served, nic, cpus)
+    else:
+        log.warning(
+            "[Affinity] None of the IRQs %s of %s is served by CPUs %s, "
+            "expect cross-core/chiplet latency", irqs, nic, cpus,
+        )
+
+
+def pin_to_cpus(cpus: List[int]):
+    """Pin this process to `cpus` and check the NIC IRQs against them."""
+    try:
+        os.sched_setaffinity(0, cpus)
+    except (AttributeError, OSError) as e:
+        log.warning("[Affinity] Cannot pin to CPUs %s: %s", cpus, e)
+        return
+
+    log.info("[Affinity] Pinned to CPUs %s", cpus)
+    if NIC_NAME:
+        check_irq_affinity(NIC_NAME, cpus)
+
+
+def setup_logging():
+    logging.basicConfig(
+        level=LOG_LEVEL,
+        format="%(asctime)s %(levelname)s %(message)s",
+    )
+
+
+def run(mappings: List[LoopMapping], cpus: List[int]):
+    """Relay `mappings` in this process (pinned to `cpus`) until interrupted."""
+    setup_logging()
+    if cpus:
+        pin_to_cpus(cpus)
+
+    try:
+        if USE_UVLOOP:
+            uvloop.run(main(mappings))
+        else:
+            asyncio.run(main(mappings))
     except KeyboardInterrupt:
-        print("Shutting down delay bot...")
+        log.info("Shutting down delay bot...")
     finally:
         try:
             # Be nice and unload kernels
@@ -284,3 +853,59 @@ if __name__ == "__main__":
                 spice.kclear()
         except Exception:
             pass
+
+
+def _direction_worker(mappings: List[LoopMapping], cpus: List[int]):
+    # Own process group: Ctrl-C only reaches the parent, which forwards it
+    os.setpgrp()
+    run(mappings, cpus)
+
+
+def run_process_per_direction(mappings: List[LoopMapping], cpus: List[int]):
+    """
+    Relay every mapping in its own spawned process until interrupted or
+    until one worker exits; the others are then stopped as well, so a
+    supervisor (systemd) sees the failure and restarts the whole bot.
+    Workers are pinned to one of `cpus` each, round robin.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    workers = [
+        ctx.Process(
+            target=_direction_worker,
+            args=([m], [cpus[i % len(cpus)]] if cpus else []),
+            name=m.name,
+        )
+        for i, m in enumerate(mappings)
+    ]
+    for w in workers:
+        w.start()
+
+    try:
+        multiprocessing.connection.wait([w.sentinel for w in workers])
+    except KeyboardInterrupt:
+        pass
+
+    for w in workers:
+        if w.is_alive():
+            os.kill(w.pid, signal.SIGINT)
+    for w in workers:
+        while w.is_alive():
+            try:
+                w.join()
+            except KeyboardInterrupt:
+                pass
+
+    failed = [w for w in workers if w.exitcode]
+    for w in failed:
+        log.error("[%s] Worker exited with code %s", w.name, w.exitcode)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    cpus = parse_cpu_list(CPU_AFFINITY)
+    if PROCESS_PER_DIRECTION:
+        setup_logging()
+        run_process_per_direction(LOOP_MAPPINGS, cpus)
+    else:
+        run(LOOP_MAPPINGS, cpus)